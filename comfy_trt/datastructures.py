@@ -5,7 +5,6 @@
 
 import json
 from dataclasses import dataclass
-import torch
 
 
 @dataclass
@@ -22,16 +21,16 @@ class ModelConfig:
 	controlnet: bool = False
 
 	def is_compatible_from_dict(self, feed_dict: dict) -> tuple[bool, float]:
+		return self.is_compatible_from_shapes({k: v.shape for k, v in feed_dict.items()})
+
+	def is_compatible_from_shapes(self, shapes: dict[str, tuple[int]]) -> tuple[bool, float]:
 		distance = 0
-		for k, v in feed_dict.items():
+		for k, shape in shapes.items():
 			_min, _opt, _max = self.profile[k]
-			v_tensor = torch.Tensor(list(v.shape))
-			r_min = torch.Tensor(_max) - v_tensor
-			r_opt = (torch.Tensor(_opt) - v_tensor).abs()
-			r_max = v_tensor - torch.Tensor(_min)
-			if torch.any(r_min < 0) or torch.any(r_max < 0):
-				return False, distance
-			distance += r_opt.sum() + 0.5 * (r_max.sum() + 0.5 * r_min.sum())
+			for v_i, min_i, opt_i, max_i in zip(shape, _min, _opt, _max):
+				if v_i < min_i or v_i > max_i:
+					return False, distance
+				distance += abs(opt_i - v_i) + 0.5 * ((v_i - min_i) + 0.5 * (max_i - v_i))
 		return True, distance
 
 	def is_compatible(self, width: int, height: int, batch_size: int, max_embedding: int) -> tuple[bool, float]:
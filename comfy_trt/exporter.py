@@ -27,12 +27,15 @@ def apply_lora(**kwargs):
 def get_refit_weights(state_dict: dict, onnx_opt_path: str, weight_name_mapping: dict, weight_shape_mapping: dict) -> dict:
 	refit_weights = OrderedDict()
 	onnx_opt_dir = os.path.dirname(onnx_opt_path)
-	onnx_opt_model = onnx.load(onnx_opt_path)
-	# Create initializer data hashes
+	onnx_opt_model = onnx.load(onnx_opt_path, load_external_data=False)
+	# Create initializer data hashes, only for initializers mapped to a torch weight
+	mapped_initializers = set(weight_name_mapping.values())
 	initializer_hash_mapping = {}
 	onnx_data_mapping = {}
 	for initializer in onnx_opt_model.graph.initializer:
-		initializer_data = torch.numpy_helper.to_array(initializer, base_dir=onnx_opt_dir).astype(np.float16)
+		if initializer.name not in mapped_initializers:
+			continue
+		initializer_data = onnx.numpy_helper.to_array(initializer, base_dir=onnx_opt_dir).astype(np.float16)
 		initializer_hash = hash(initializer_data.data.tobytes())
 		initializer_hash_mapping[initializer.name] = initializer_hash
 		onnx_data_mapping[initializer.name] = initializer_data
@@ -193,13 +193,13 @@ class UNetModel:
 		state_dict = self.unet.state_dict()
 		onnx_opt_model = onnx.load(onnx_opt_path)
 
-		# Create initializer data hashes
+		# Create initializer data hashes, indexed by hash so each weight is matched with a single lookup
 		def init_hash_map(onnx_opt_model):
 			initializer_hash_mapping = {}
-			for initializer in onnx_opt_model.graph.initializer:
+			for idx, initializer in enumerate(onnx_opt_model.graph.initializer):
 				initializer_data = onnx.numpy_helper.to_array(initializer, base_dir=onnx_opt_dir).astype(np.float16)
 				initializer_hash = hash(initializer_data.data.tobytes())
-				initializer_hash_mapping[initializer.name] = (initializer_hash, initializer_data.shape)
+				initializer_hash_mapping.setdefault(initializer_hash, []).append((idx, initializer.name, initializer_data.shape, initializer_hash))
 			return initializer_hash_mapping
 
 		initializer_hash_mapping = init_hash_map(onnx_opt_model)
@@ -213,17 +213,19 @@ class UNetModel:
 			wt_hash = hash(wt.data.tobytes())
 			wt_t_hash = hash(np.transpose(wt).data.tobytes())
 
-			for initializer_name, (initializer_hash, initializer_shape) in initializer_hash_mapping.items():
-				# Due to constant folding, some weights are transposed during export
-				# To account for the transpose op, we compare the initializer hash to the hash for the weight and its transpose
-				if wt_hash == initializer_hash or wt_t_hash == initializer_hash:
-					# The assert below ensures there is a 1:1 mapping between PyTorch and ONNX weight names.
-					# It can be removed in cases where 1:many mapping is found and name_mapping[wt_name] = list()
-					assert initializer_name not in initializers_mapped
-					weights_name_mapping[wt_name] = initializer_name
-					initializers_mapped.add(initializer_name)
-					is_transpose = wt_hash != initializer_hash
-					weights_shape_mapping[wt_name] = (initializer_shape, is_transpose)
+			# Due to constant folding, some weights are transposed during export
+			# To account for the transpose op, we compare the initializer hash to the hash for the weight and its transpose
+			candidates = initializer_hash_mapping.get(wt_hash, [])
+			if wt_t_hash != wt_hash:
+				candidates = sorted(candidates + initializer_hash_mapping.get(wt_t_hash, []))  # keep graph order
+			for _, initializer_name, initializer_shape, initializer_hash in candidates:
+				# The assert below ensures there is a 1:1 mapping between PyTorch and ONNX weight names.
+				# It can be removed in cases where 1:many mapping is found and name_mapping[wt_name] = list()
+				assert initializer_name not in initializers_mapped
+				weights_name_mapping[wt_name] = initializer_name
+				initializers_mapped.add(initializer_name)
+				is_transpose = wt_hash != initializer_hash
+				weights_shape_mapping[wt_name] = (initializer_shape, is_transpose)
 
 			# Sanity check: Were any weights not matched
 			if wt_name not in weights_name_mapping:
@@ -8,7 +8,6 @@ import hashlib
 import json
 import os
 import logging
-import copy
 import torch
 
 from .datastructures import ModelConfig, ModelConfigEncoder
@@ -72,24 +71,26 @@ class ModelManager:
 		return os.path.join(TRT_MODEL_DIR, f"{model_name}_weights_map.json")
 
 	def update(self) -> None:
-		trt_engines = [trt_file for trt_file in os.listdir(TRT_MODEL_DIR) if trt_file.endswith(".trt")]
+		trt_engines = {entry.name for entry in os.scandir(TRT_MODEL_DIR) if entry.name.endswith(".trt")}
 
-		tmp_all_models = copy.deepcopy(self.all_models)
-		for cc, base_models in tmp_all_models.items():
-			for base_model, models in base_models.items():
-				tmp_config_list = {}
-				for model_config in models:
+		changed = False
+		for base_models in self.all_models.values():
+			for base_model in list(base_models):
+				kept = []
+				for model_config in base_models[base_model]:
 					if model_config["filepath"] not in trt_engines:
 						logging.info(f"Model config outdated. {model_config['filepath']} was not found")
 						continue
-					tmp_config_list[model_config["filepath"]] = model_config
-
-				tmp_config_list = list(tmp_config_list.values())
-				if len(tmp_config_list) == 0:
-					self.all_models[cc].pop(base_model)
+					kept.append(model_config)
+				if len(kept) == len(base_models[base_model]):
+					continue
+				if len(kept) == 0:
+					base_models.pop(base_model)
 				else:
-					self.all_models[cc][base_model] = models
-		self.write_json()
+					base_models[base_model] = kept
+				changed = True
+		if changed or not os.path.exists(self.model_file):
+			self.write_json()
 
 	def add_entry(
 		self,
@@ -133,8 +134,12 @@ class ModelManager:
 		self.write_json()
 
 	def write_json(self) -> None:
-		with open(self.model_file, "w") as f:
-			json.dump(self.all_models, f, indent=2, cls=ModelConfigEncoder)
+		# avoid orjson as new dependency, stdlib json without indent is fast enough for the registry
+		# write to temp file then swap so a crash mid-write never leaves a truncated model.json
+		tmp_file = self.model_file + ".tmp"
+		with open(tmp_file, "w") as f:
+			json.dump(self.all_models, f, cls=ModelConfigEncoder)
+		os.replace(tmp_file, self.model_file)
 
 	def read_json(self, encode_config: bool = True) -> dict:
 		with open(self.model_file, "r") as f:
@@ -143,10 +148,10 @@ class ModelManager:
 		if not encode_config:
 			return out
 
-		for cc, models in out.items():
-			for base_model, configs in models.items():
-				for i in range(len(configs)):
-					out[cc][base_model][i]["config"] = ModelConfig(**configs[i]["config"])
+		for models in out.values():
+			for configs in models.values():
+				for model in configs:
+					model["config"] = ModelConfig(**model["config"])
 		return out
 
 	def available_models(self) -> dict:
@@ -168,9 +173,10 @@ class ModelManager:
 		return cache
 
 	def get_valid_models_from_dict(self, base_model: str, feed_dict: dict) -> tuple[list[bool], list[float]]:
+		shapes = {k: tuple(v.shape) for k, v in feed_dict.items()}  # extract once for all engines
 		valid_models, distances = [], []
 		for model in self.available_models()[base_model]:
-			valid, distance = model["config"].is_compatible_from_dict(feed_dict)
+			valid, distance = model["config"].is_compatible_from_shapes(shapes)
 			if valid:
 				valid_models.append(model)
 				distances.append(distance)
@@ -187,4 +193,12 @@ class ModelManager:
 		return valid_models, distances, idx
 
 
-modelmanager = ModelManager()
+_modelmanager = None
+
+
+def get_modelmanager() -> ModelManager:
+	"""lazy singleton, avoid scanning engine dir & reading/writing model.json on import"""
+	global _modelmanager
+	if _modelmanager is None:
+		_modelmanager = ModelManager()
+	return _modelmanager
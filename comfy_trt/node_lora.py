@@ -11,7 +11,7 @@ import onnx
 import torch
 from torch.cuda import nvtx
 
-from .model_manager import ONNX_MODEL_DIR, modelmanager
+from .model_manager import ONNX_MODEL_DIR, ModelManager
 
 import folder_paths  # comfy stuff
 from comfy.utils import load_torch_file
@@ -42,7 +42,7 @@ class TRT_Lora_Loader:
 		return inputs
 
 	def lora_stacker(self, trt_unet_model, LORA_COUNT, **kwargs):
-		_, onnx_base_path = modelmanager.get_onnx_path(trt_unet_model.model.model_name)
+		_, onnx_base_path = ModelManager.get_onnx_path(trt_unet_model.model.model_name)
 		loras_list: list[tuple[str, float]] = [
 			(name, kwargs.get(f"lora_wt_{i+1}"))
 			for i in range(LORA_COUNT)
@@ -65,7 +65,7 @@ def apply_loras(onnx_base_path: str, loras_list: list[tuple[str, float]]) -> dic
 				refit_dict[k] += weight * v
 			else:
 				refit_dict[k] = weight * v
-	base = onnx.load(onnx_base_path)
+	base = onnx.load(onnx_base_path, load_external_data=False)  # only names needed here, weights read per-initializer below
 	for initializer in base.graph.initializer:
 		if initializer.name in refit_dict:
 			wt = refit_dict[initializer.name]
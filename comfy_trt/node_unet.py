@@ -20,7 +20,7 @@ import os
 import torch
 from torch.cuda import nvtx
 
-from .model_manager import TRT_MODEL_DIR, modelmanager
+from .model_manager import TRT_MODEL_DIR, get_modelmanager
 from .utilities import Engine
 
 from comfy.model_base import ModelType, model_sampling  # ModelType used in eval() - do not remove
@@ -28,9 +28,6 @@ import comfy.supported_models as LIST_MODELS  # used in eval() - do not remove
 from comfy import model_management
 
 
-LIST_ENGINES = modelmanager.available_models()
-
-
 class TRT_Unet_Loader:
 	"""ComfyUI node"""
 
@@ -41,7 +38,7 @@ class TRT_Unet_Loader:
 	@classmethod
 	def INPUT_TYPES(cls):
 		return {"required": {
-			"engine_file": (list(LIST_ENGINES.keys()),),
+			"engine_file": (list(get_modelmanager().available_models().keys()),),
 			################################################# test: convert directly in GUI
 			# "model" : ("MODEL",),
 			# "batch_min": ("INT", {"default": 1, "min": 1, "max": 16}),
@@ -62,7 +59,7 @@ class TRT_Unet_Loader:
 		}}
 
 	def load_trt(self, engine_file: str) -> tuple:
-		configs: list = LIST_ENGINES[engine_file]
+		configs: list = get_modelmanager().available_models()[engine_file]
 		if configs[0]["config"].lora:
 			model_name = configs[0]["base_model"]
 			lora_path = os.path.join(TRT_MODEL_DIR, configs[0]["filepath"])
@@ -234,5 +231,6 @@ class TrtUnet:
 		self.engine.activate(True)
 
 	def deactivate(self):
-		del self.engine
+		if self.engine is not None:
+			self.engine.close()
 		self.engine = None
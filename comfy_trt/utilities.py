@@ -21,7 +21,7 @@
 
 from collections import OrderedDict
 import logging
-import copy
+import math
 import numpy as np
 from polygraphy.backend.common import bytes_from_path
 from polygraphy import util as polyutil  # rename to avoid confusion
@@ -91,16 +91,16 @@ class Engine:
 		self.context: trt.tensorrt.IExecutionContext = None
 		self.buffers = OrderedDict()
 		self.tensors = OrderedDict()
+		self._input_bindings = None  # (name, shape, dtype) of inputs currently allocated
+		self._addresses_bound = False
 
-	def __del__(self):
-		del self.engine
-		del self.context
-		del self.buffers
-		del self.tensors
+	def close(self) -> None:
+		# context must be destroyed before the engine it was created from
+		self.context = None
+		self.engine = None
 
 	def reset(self, engine_path=None) -> None:
-		del self.engine
-		del self.context
+		self.close()
 		del self.buffers
 		del self.tensors
 		self.engine_path = engine_path
@@ -108,25 +108,23 @@ class Engine:
 		self.tensors = OrderedDict()
 		self.inputs = {}
 		self.outputs = {}
+		self._input_bindings = None
+		self._addresses_bound = False
 
 	def refit_from_dict(self, refit_weights: dict, is_fp16: bool) -> None:
 		# Initialize refitter
 		refitter = trt.Refitter(self.engine, TRT_LOGGER)
 
-		refitted_weights = set()
-		# iterate through all tensorrt refittable weights
-		for trt_weight_name in refitter.get_all_weights():
-			if trt_weight_name not in refit_weights:
-				continue
-
-			# get weight from state dict
-			trt_datatype = trt.DataType.FLOAT
-			if is_fp16:
-				refit_weights[trt_weight_name] = refit_weights[trt_weight_name].half()
-				trt_datatype = trt.DataType.HALF
+		trt_datatype = trt.DataType.HALF if is_fp16 else trt.DataType.FLOAT
+		torch_dtype = torch.float16 if is_fp16 else torch.float32
 
+		refitted_weights = set()
+		# only visit weights present in both refit dict & engine, lora touch a small part of all refittable weights
+		for trt_weight_name in refit_weights.keys() & set(refitter.get_all_weights()):
 			# trt.Weight and trt.TensorLocation
-			refit_weights[trt_weight_name] = refit_weights[trt_weight_name].cpu()
+			# cast + move in one copy, contiguous() is a no-op unless the tensor is strided
+			# keep reference in dict so memory stays alive until refit_cuda_engine
+			refit_weights[trt_weight_name] = refit_weights[trt_weight_name].to(device="cpu", dtype=torch_dtype).contiguous()
 			trt_wt_tensor = trt.Weights(
 				trt_datatype,
 				refit_weights[trt_weight_name].data_ptr(),
@@ -189,8 +187,7 @@ class Engine:
 		if cache is not None:
 			config.set_timing_cache(cache, ignore_mismatch=True)
 
-		profiles = copy.deepcopy(p)
-		for profile in profiles:
+		for profile in p:  # fill_defaults mutates in place, fine as p is built above and not reused
 			# Last profile is used for set_calibration_profile.
 			calib_profile = profile.fill_defaults(network[1]).to_trt(builder, network[1])
 			config.add_optimization_profile(calib_profile)
@@ -217,9 +214,11 @@ class Engine:
 			if reuse_device_memory
 			else self.engine.create_execution_context()
 		)
+		self._addresses_bound = False
 
 	def allocate_buffers(self, shape_dict: dict = None, device: str = "cuda", additional_shapes: dict = None) -> None:
 		nvtx.range_push("allocate_buffers")
+		inputs, outputs = [], []
 		for idx in range(self.engine.num_io_tensors):
 			binding = self.engine[idx]
 			if shape_dict is not None and binding in shape_dict:
@@ -228,19 +227,51 @@ class Engine:
 				shape = additional_shapes[binding]
 			else:
 				shape = self.context.get_binding_shape(idx)
+				if any(x < 0 for x in shape):  # only unresolved dynamic dims are negative, should not happen after set_binding_shape
+					logging.warning(f"Binding {binding} has unresolved dynamic shape {shape}, allocating with absolute dims.")
+					shape = [abs(x) for x in shape]
 			dtype = trt.nptype(self.engine.get_binding_dtype(binding))
 			if self.engine.binding_is_input(binding):
 				self.context.set_binding_shape(idx, shape)
-			tensor = torch.zeros(tuple(shape), dtype=numpy_to_torch_dtype_dict[dtype]).to(device=device)
-			self.tensors[binding] = tensor
+				inputs.append((binding, tuple(shape), dtype))
+			else:
+				outputs.append((binding, tuple(shape), dtype))
+
+		# single zeroed device allocation for all inputs, each tensor is a view aligned to 256 bytes
+		# inputs not in feed_dict of infer() (e.g. control_i) must read as zeros
+		# re-used as long as input shapes do not change, so their addresses stay bound
+		if inputs != self._input_bindings:
+			offsets, total_bytes = [], 0
+			for _, shape, dtype in inputs:
+				nbytes = math.prod(shape) * np.dtype(dtype).itemsize
+				offsets.append((total_bytes, nbytes))
+				total_bytes += -(-nbytes // 256) * 256
+			arena = torch.zeros(total_bytes, dtype=torch.uint8, device=device)
+			for (binding, shape, dtype), (offset, nbytes) in zip(inputs, offsets):
+				self.tensors[binding] = arena[offset:offset + nbytes].view(numpy_to_torch_dtype_dict[dtype]).view(shape)
+			self._input_bindings = inputs
+			self._addresses_bound = False
+		# outputs allocated separately so the returned tensors do not keep the input arena alive
+		# always fresh, the caller may still hold the previous step's output
+		for binding, shape, dtype in outputs:
+			self.tensors[binding] = torch.empty(shape, dtype=numpy_to_torch_dtype_dict[dtype], device=device)
+		if self._addresses_bound:
+			self._bind_addresses(binding for binding, _, _ in outputs)
+		else:
+			self._bind_addresses(self.tensors)
 		nvtx.range_pop()
 
+	def _bind_addresses(self, names) -> None:
+		for name in names:
+			self.context.set_tensor_address(name, self.tensors[name].data_ptr())
+		self._addresses_bound = True
+
 	def infer(self, feed_dict: dict, stream: int) -> OrderedDict[str, torch.Tensor]:
 		nvtx.range_push("set_tensors")
 		for name, buf in feed_dict.items():
 			self.tensors[name].copy_(buf)
-		for name, tensor in self.tensors.items():
-			self.context.set_tensor_address(name, tensor.data_ptr())
+		if not self._addresses_bound:  # inputs only move when re-allocated or on a new context
+			self._bind_addresses(self.tensors)
 		nvtx.range_pop()
 		nvtx.range_push("execute")
 		noerror = self.context.execute_async_v3(stream)
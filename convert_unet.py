@@ -12,7 +12,7 @@ import torch
 
 from comfy_trt.exporter import export_onnx, export_trt
 from comfy_trt.model_helper import UNetModel
-from comfy_trt.model_manager import modelmanager, cc_major
+from comfy_trt.model_manager import get_modelmanager, cc_major
 from comfy_trt.datastructures import ProfileSettings
 
 sys.path.append(os.path.join("..", ".."))
@@ -64,6 +64,7 @@ def get_config_from_checkpoint(ckpt_path: str) -> dict:
 
 if __name__ == "__main__":
 	args = parseArgs()
+	modelmanager = get_modelmanager()
 
 	ckpt_config = get_config_from_checkpoint(args.ckpt_path)
 	if cc_major < 7: